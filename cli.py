@@ -12,11 +12,16 @@ This lets you:
 
 import argparse
 import asyncio
+import re
 from typing import List
 
 from guttenread_mcp.server import search_gutenberg
 
 
+# Separators between titles: a comma or semicolon plus any surrounding whitespace
+_SEP_RE = re.compile(r"\s*[;,]\s*")
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Search Project Gutenberg via Gutendex.")
     parser.add_argument(
@@ -48,13 +53,7 @@ def prompt_for_titles() -> List[str]:
     raw = input("Enter book titles (comma- or semicolon-separated): ").strip()
     if not raw:
         return []
-    # Split on comma or semicolon
-    parts: List[str] = []
-    for chunk in raw.replace(";", ",").split(","):
-        title = chunk.strip()
-        if title:
-            parts.append(title)
-    return parts
+    return [t for t in _SEP_RE.split(raw) if t]
 
 
 async def run_cli() -> None:
@@ -15,17 +15,110 @@ model can call this tool to retrieve the data.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional, Tuple
-
-import requests
+import os
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from aiohttp_client_cache.cache_control import DO_NOT_CACHE
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    import json
+
+    _json_loads = json.loads
+
 
 # Name the server so it shows up clearly in your MCP client.
 mcp = FastMCP("guttenread-gutendex")
 
 
 GUTENDEX_BASE_URL = "https://gutendex.com/books"
+GUTENBERG_BASE_URL = "https://www.gutenberg.org"
+
+# Connection limits for the shared aiohttp session used by a single search.
+HTTP_CONNECTION_LIMIT = 32
+HTTP_CONNECTION_LIMIT_PER_HOST = 8
+HTTP_TOTAL_TIMEOUT = 30
+
+# Read size used when streaming text downloads.
+DOWNLOAD_CHUNK_SIZE = 8192
+
+# Retry policy for transient failures (rate limiting, gateway errors, dropped connections).
+HTTP_MAX_RETRIES = 2
+HTTP_RETRY_BACKOFF = 0.2
+HTTP_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Sent with every request; aiohttp keeps connections alive by default.
+HTTP_DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "guttenread/1.0",
+}
+
+# Persistent on-disk HTTP cache, stored in the per-user cache directory
+# ($XDG_CACHE_HOME/guttenread, default ~/.cache/guttenread). Gutenberg texts are
+# immutable per book ID, so they can be kept for a long time; search results
+# are refreshed more often. Only searches and full-text downloads are cached
+# (truncated downloads bypass it), and the file is discarded when it is opened
+# and has grown past HTTP_CACHE_MAX_BYTES.
+HTTP_CACHE_FILENAME = "http_cache.sqlite"
+HTTP_CACHE_MAX_BYTES = 512 * 1024 * 1024
+HTTP_CACHE_EXPIRE_AFTER = {
+    "gutendex.com": timedelta(days=1),
+    "*": timedelta(days=30),
+}
+
+# Successful Gutendex searches are memoized in-process, keyed on the
+# normalized title and result limit. In-flight searches are shared by callers
+# on the same HTTP session (i.e. within one `search_gutenberg` call), so a
+# cancelled call can't break another call's search by closing its session.
+SEARCH_CACHE_MAXSIZE = 1024
+# Entries expire on the same schedule as cached Gutendex HTTP responses.
+SEARCH_CACHE_TTL = HTTP_CACHE_EXPIRE_AFTER["gutendex.com"].total_seconds()
+
+# Keep responses compact: they are often fed back into an LLM context.
+MAX_SUBJECTS = 8
+MAX_BOOKSHELVES = 4
+
+# Match fields omitted from responses unless explicitly requested via `fields`.
+OPT_IN_FIELDS = frozenset({"copyright"})
+
+# Archive suffixes, matched with str.endswith(tuple) to avoid lowercasing every URL.
+_ZIP_SUFFIXES = (".zip", ".ZIP", ".Zip")
+_GZIP_SUFFIXES = (".gz", ".GZ", ".Gz")
+
+
+class _SharedCache:
+    """The SQLite cache backend shared by all searches running on one event loop."""
+
+    def __init__(self, opening: "asyncio.Future[Optional[SQLiteBackend]]") -> None:
+        self.opening = opening
+        self.users = 0
+
+
+# One backend (and so one SQLite connection) per event loop, so concurrent
+# searches don't compete for the database write lock.
+_shared_caches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_SearchKey = Tuple[str, int]
+# Values are (time.monotonic() when stored, results).
+_search_cache: "OrderedDict[_SearchKey, Tuple[float, Tuple[Dict[str, Any], ...]]]" = OrderedDict()
+_search_inflight: Dict[
+    Tuple[aiohttp.ClientSession, _SearchKey], "asyncio.Future[Tuple[List[Dict[str, Any]], Optional[str]]]"
+] = {}
 
 
 def _pick_best_text_format(formats: Dict[str, str]) -> Optional[str]:
@@ -54,40 +147,213 @@ def _pick_best_text_format(formats: Dict[str, str]) -> Optional[str]:
         url = formats.get(key)
         if url and isinstance(url, str):
             # Exclude zipped / binary variants if they slip in
-            if not url.lower().endswith(".zip"):
+            if not url.endswith(_ZIP_SUFFIXES):
                 return url
 
     # Fallback: any text/* that is not a zip
     for key, url in formats.items():
         if not isinstance(url, str):
             continue
-        if key.startswith("text/") and not url.lower().endswith(".zip"):
+        if key.startswith("text/") and not url.endswith(_ZIP_SUFFIXES):
             return url
 
     return None
 
 
-def _search_gutendex(title: str, max_results: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+def _direct_text_url(book_id: int) -> str:
+    """
+    Build the canonical plain-text URL for a Gutenberg book ID.
+
+    Project Gutenberg serves every book's UTF-8 text from a fixed location
+    under `/cache/epub/`, so no Gutendex lookup is needed to find it.
+    """
+    return f"{GUTENBERG_BASE_URL}/cache/epub/{book_id}/pg{book_id}.txt"
+
+
+def _cache_dir() -> Path:
+    """Return the per-user directory holding the HTTP cache."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "guttenread"
+
+
+def _discard_oversized_cache(cache_path: Path) -> None:
+    """
+    Delete the cache database (and any SQLite side files) if it has grown
+    past HTTP_CACHE_MAX_BYTES, so the cache starts over empty.
+    """
+    try:
+        if cache_path.stat().st_size <= HTTP_CACHE_MAX_BYTES:
+            return
+    except FileNotFoundError:
+        return
+
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        try:
+            Path(f"{cache_path}{suffix}").unlink()
+        except OSError:
+            # Missing, or still in use elsewhere; keep using it as is
+            pass
+
+
+async def _open_cache_backend() -> Optional[SQLiteBackend]:
     """
-    Search Gutendex for a single title.
+    Open the on-disk HTTP cache.
+
+    Returns None if it can't be used (e.g. the cache directory is not writable),
+    in which case searches run without a cache.
+    """
+    try:
+        cache_dir = _cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path = cache_dir / HTTP_CACHE_FILENAME
+        _discard_oversized_cache(cache_path)
+        backend = SQLiteBackend(
+            cache_name=str(cache_path),
+            urls_expire_after=HTTP_CACHE_EXPIRE_AFTER,
+            allowed_methods=("GET",),
+            cache_control=True,
+            # Shared across sessions; closed by `_http_session` when the last user is done
+            autoclose=False,
+        )
+        # The database is opened lazily; touch it now so failures surface here
+        await backend.responses.size()
+    except Exception:  # noqa: BLE001
+        return None
+    return backend
+
+
+@asynccontextmanager
+async def _http_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Create the HTTP session used by a single `search_gutenberg` call.
+
+    The session uses the shared on-disk cache when it is available, and a
+    plain aiohttp session otherwise. The cache backend is closed once the
+    last session on this event loop is done with it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+    )
+    session_kwargs: Dict[str, Any] = {
+        "connector": connector,
+        "timeout": aiohttp.ClientTimeout(total=HTTP_TOTAL_TIMEOUT),
+        "headers": HTTP_DEFAULT_HEADERS,
+    }
+
+    loop = asyncio.get_running_loop()
+    shared = _shared_caches.get(loop)
+    if shared is None:
+        shared = _SharedCache(loop.create_task(_open_cache_backend()))
+        _shared_caches[loop] = shared
+    shared.users += 1
+
+    try:
+        backend = await asyncio.shield(shared.opening)
+        if backend is None:
+            async with aiohttp.ClientSession(**session_kwargs) as session:
+                yield session
+        else:
+            async with CachedSession(cache=backend, **session_kwargs) as session:
+                yield session
+    finally:
+        shared.users -= 1
+        if shared.users == 0:
+            if _shared_caches.get(loop) is shared:
+                del _shared_caches[loop]
+            backend = await shared.opening
+            if backend is not None:
+                await backend.close()
+
+
+async def _get_with_retries(session: aiohttp.ClientSession, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
+    """
+    Issue a GET request, retrying transient failures with exponential backoff.
+
+    The caller is responsible for releasing the returned response
+    (e.g. `async with await _get_with_retries(...) as resp:`).
+    """
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        last_attempt = attempt == HTTP_MAX_RETRIES
+        try:
+            resp = await session.get(url, **kwargs)
+        except aiohttp.ClientConnectionError:
+            if last_attempt:
+                raise
+        else:
+            if resp.status not in HTTP_RETRY_STATUSES or last_attempt:
+                return resp
+            resp.release()
+        await asyncio.sleep(HTTP_RETRY_BACKOFF * (2**attempt))
+
+    raise AssertionError("unreachable")
+
+
+async def _search_gutendex(
+    session: aiohttp.ClientSession, title: str, max_results: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Search Gutendex for a single title, using the in-process search cache.
+
+    Returns (results, error_message). If error_message is not None, an error occurred.
+    """
+    key: _SearchKey = (title.lower().strip(), max_results)
+
+    cached = _search_cache.get(key)
+    if cached is not None:
+        stored_at, cached_results = cached
+        if time.monotonic() - stored_at < SEARCH_CACHE_TTL:
+            _search_cache.move_to_end(key)
+            return list(cached_results), None
+        del _search_cache[key]
+
+    inflight_key = (session, key)
+    future = _search_inflight.get(inflight_key)
+    if future is None:
+        future = asyncio.get_running_loop().create_task(_fetch_gutendex(session, title, max_results))
+        _search_inflight[inflight_key] = future
+
+        def _forget(done: asyncio.Future, key: _SearchKey = key) -> None:
+            if _search_inflight.get((session, key)) is done:
+                del _search_inflight[(session, key)]
+            if not done.cancelled() and done.exception() is None:
+                results, error = done.result()
+                if error is None:
+                    _search_cache[key] = (time.monotonic(), tuple(results))
+                    _search_cache.move_to_end(key)
+                    while len(_search_cache) > SEARCH_CACHE_MAXSIZE:
+                        _search_cache.popitem(last=False)
+
+        future.add_done_callback(_forget)
+
+    # Shield the shared request so one cancelled caller doesn't cancel it for the others
+    results, error = await asyncio.shield(future)
+    return list(results), error
+
+
+async def _fetch_gutendex(
+    session: aiohttp.ClientSession, title: str, max_results: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Query the Gutendex API for a single title, bypassing the search cache.
 
     Returns (results, error_message). If error_message is not None, an error occurred.
     """
     try:
-        response = requests.get(
+        async with await _get_with_retries(
+            session,
             GUTENDEX_BASE_URL,
             params={"search": title},
-            timeout=15,
-        )
-        response.raise_for_status()
+            timeout=aiohttp.ClientTimeout(total=15),
+        ) as response:
+            response.raise_for_status()
+            try:
+                data = _json_loads(await response.read())
+            except Exception as exc:  # noqa: BLE001
+                return [], f"Failed to decode JSON response from Gutendex: {exc}"
     except Exception as exc:  # noqa: BLE001
         return [], f"HTTP error while querying Gutendex: {exc}"
 
-    try:
-        data = response.json()
-    except Exception as exc:  # noqa: BLE001
-        return [], f"Failed to decode JSON response from Gutendex: {exc}"
-
     results = data.get("results", [])
     if not isinstance(results, list):
         return [], "Unexpected Gutendex response format: 'results' is not a list"
@@ -95,69 +361,116 @@ def _search_gutendex(title: str, max_results: int) -> Tuple[List[Dict[str, Any]]
     return results[:max_results], None
 
 
-def _download_text(url: str, max_chars: Optional[int]) -> Tuple[Optional[str], Optional[str]]:
+async def _download_text(
+    session: aiohttp.ClientSession, url: str, max_chars: Optional[int]
+) -> Tuple[Optional[str], Optional[str]]:
     """
     Download text content from the given URL.
 
+    When `max_chars` is set, the body is streamed and reading stops as soon
+    as enough bytes have arrived to decode `max_chars` characters. Such
+    truncated reads bypass the disk cache, which would otherwise download
+    the whole body to store it.
+
     Returns (text_or_excerpt, error_message).
     """
+    truncate = max_chars is not None and max_chars > 0
+    request_kwargs: Dict[str, Any] = {}
+    if truncate and isinstance(session, CachedSession):
+        request_kwargs["expire_after"] = DO_NOT_CACHE
     try:
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
+        async with await _get_with_retries(session, url, **request_kwargs) as resp:
+            resp.raise_for_status()
+            # Transfer compression is undone by aiohttp, but `.gz` files served
+            # without a Content-Encoding header arrive still compressed.
+            gunzip = None
+            if url.endswith(_GZIP_SUFFIXES) and "Content-Encoding" not in resp.headers:
+                gunzip = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            if truncate:
+                # Worst case for UTF-8 is 4 bytes per character
+                byte_limit = max_chars * 4
+                buf = bytearray()
+                async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    buf += gunzip.decompress(chunk) if gunzip else chunk
+                    if len(buf) >= byte_limit:
+                        break
+                raw = bytes(buf)
+            else:
+                raw = await resp.read()
+                if gunzip:
+                    raw = gunzip.decompress(raw)
+            # Try best-effort decoding; Gutendex typically returns UTF-8.
+            encoding = resp.charset or "utf-8"
     except Exception as exc:  # noqa: BLE001
         return None, f"HTTP error while downloading text: {exc}"
 
-    # Try best-effort decoding; Gutendex typically returns UTF-8.
-    resp.encoding = resp.encoding or "utf-8"
-    text = resp.text
+    text = raw.decode(encoding, errors="replace")
 
-    if max_chars is not None and max_chars > 0 and len(text) > max_chars:
+    if truncate and len(text) > max_chars:
         return text[:max_chars], None
 
     return text, None
 
 
-def _normalize_book(book: Dict[str, Any], download_text: bool, max_chars: Optional[int]) -> Dict[str, Any]:
+def _fetch_text(
+    session: aiohttp.ClientSession,
+    text_url: str,
+    max_chars: Optional[int],
+    downloads: Dict[str, "asyncio.Future[Tuple[Optional[str], Optional[str]]]"],
+) -> "asyncio.Future[Tuple[Optional[str], Optional[str]]]":
+    """
+    Start (or join) the download of `text_url`.
+
+    `downloads` maps text URLs to in-flight downloads, so matches that share
+    a URL (e.g. the same book found by two queries) are only fetched once.
+    """
+    future = downloads.get(text_url)
+    if future is None:
+        future = asyncio.ensure_future(_download_text(session, text_url, max_chars=max_chars))
+        downloads[text_url] = future
+    return future
+
+
+def _normalize_book_metadata(book: Dict[str, Any], resolve_text_url: bool = True) -> Dict[str, Any]:
     """
     Turn a raw Gutendex `book` record into a compact, structured dict.
-    Optionally download the text (or an excerpt) if available.
+
+    This does no I/O; texts are fetched separately with `_fetch_text`.
+    If `resolve_text_url` is False, the formats are not scanned and
+    `text_url` is None.
     """
-    book_id = book.get("id")
-    title = book.get("title")
-    languages = book.get("languages") or []
-    download_count = book.get("download_count")
-    subjects = book.get("subjects") or []
-    bookshelves = book.get("bookshelves") or []
-    copyright_ = book.get("copyright")
-    formats = book.get("formats") or {}
+    g = book.get
+    book_id = g("id")
+    title = g("title")
+    languages = g("languages") or []
+    download_count = g("download_count")
+    subjects = (g("subjects") or [])[:MAX_SUBJECTS]
+    bookshelves = (g("bookshelves") or [])[:MAX_BOOKSHELVES]
+    copyright_ = g("copyright")
+    formats = g("formats") or {}
 
     # Authors come as a list of objects with 'name', 'birth_year', 'death_year'
-    raw_authors = book.get("authors") or []
-    authors: List[Dict[str, Any]] = []
-    for author in raw_authors:
-        if not isinstance(author, dict):
-            continue
-        authors.append(
-            {
-                "name": author.get("name"),
-                "birth_year": author.get("birth_year"),
-                "death_year": author.get("death_year"),
-            }
-        )
+    authors: List[Dict[str, Any]] = [
+        {
+            "name": a.get("name"),
+            "birth_year": a.get("birth_year"),
+            "death_year": a.get("death_year"),
+        }
+        for a in g("authors") or []
+        if isinstance(a, dict)
+    ]
 
     # Build canonical Gutenberg URL if we have an ID
     gutenberg_url = None
     if isinstance(book_id, int):
-        gutenberg_url = f"https://www.gutenberg.org/ebooks/{book_id}"
+        gutenberg_url = f"{GUTENBERG_BASE_URL}/ebooks/{book_id}"
 
-    text_url = _pick_best_text_format(formats)
+    text_url = _pick_best_text_format(formats) if resolve_text_url else None
+    if resolve_text_url and text_url is None and not formats and isinstance(book_id, int):
+        # No formats listed: fall back to Gutenberg's deterministic cache URL
+        text_url = _direct_text_url(book_id)
 
-    text: Optional[str] = None
-    text_error: Optional[str] = None
-    if download_text and text_url:
-        text, text_error = _download_text(text_url, max_chars=max_chars)
-
-    normalized: Dict[str, Any] = {
+    return {
         "id": book_id,
         "title": title,
         "authors": authors,
@@ -170,12 +483,19 @@ def _normalize_book(book: Dict[str, Any], download_text: bool, max_chars: Option
         "text_url": text_url,
     }
 
-    if download_text:
-        normalized["text"] = text
-        if text_error:
-            normalized["text_error"] = text_error
 
-    return normalized
+def _select_fields(match: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    Restrict a normalized match to the requested `fields`.
+
+    With no explicit selection, everything except the opt-in fields is kept.
+    Downloaded text is always kept, since it is requested separately.
+    """
+    if fields is None:
+        return {k: v for k, v in match.items() if k not in OPT_IN_FIELDS}
+    wanted = set(fields)
+    wanted.update(("text", "text_error"))
+    return {k: v for k, v in match.items() if k in wanted}
 
 
 @mcp.tool()
@@ -184,6 +504,8 @@ async def search_gutenberg(
     max_results_per_title: int = 3,
     download_text: bool = False,
     max_chars: Optional[int] = 20000,
+    fields: Optional[List[str]] = None,
+    include_text_url: bool = True,
 ) -> Dict[str, Any]:
     """
     Search Project Gutenberg via Gutendex for a list of titles.
@@ -200,6 +522,15 @@ async def search_gutenberg(
     max_chars:
         If set (default 20,000), truncate downloaded texts to at most
         this many characters. Set to None to return full texts.
+    fields:
+        If set, only include these keys in each match (e.g.
+        ["id", "title", "authors", "gutenberg_url"]). "text" and
+        "text_error" are still included when download_text is True.
+        By default all fields except "copyright" are returned.
+    include_text_url:
+        If False (and download_text is False), skip resolving "text_url"
+        for each match; it is returned as None. This is also skipped when
+        `fields` is given without "text_url".
 
     Returns
     -------
@@ -215,9 +546,9 @@ async def search_gutenberg(
               "authors": [{"name": ..., "birth_year": ..., "death_year": ...}],
               "languages": [...],
               "download_count": ...,
-              "subjects": [...],
-              "bookshelves": [...],
-              "copyright": ...,
+              "subjects": [... (at most 8)],
+              "bookshelves": [... (at most 4)],
+              "copyright": ... (only if requested via `fields`),
               "gutenberg_url": "https://www.gutenberg.org/ebooks/<id>",
               "text_url": "...",
               "text": "... (optional, if download_text=True)",
@@ -233,40 +564,71 @@ async def search_gutenberg(
     """
     if not isinstance(titles, list):
         raise TypeError("titles must be a list of strings")
+    if fields is not None and not isinstance(fields, list):
+        raise TypeError("fields must be a list of strings or None")
 
     cleaned_titles = [t for t in (str(t).strip() for t in titles) if t]
     if not cleaned_titles:
         return {"results": []}
 
+    # Search each distinct title once (case-insensitively), keeping the first spelling
+    unique_titles: Dict[str, str] = {}
+    for t in cleaned_titles:
+        unique_titles.setdefault(t.lower(), t)
+
     if max_results_per_title <= 0:
         max_results_per_title = 1
 
-    results: List[Dict[str, Any]] = []
-
-    loop = asyncio.get_event_loop()
+    # Text URLs are only worth resolving if we download texts or the caller returns them
+    resolve_text_url = download_text or (include_text_url and (fields is None or "text_url" in fields))
 
-    # Because `requests` is synchronous, offload HTTP calls to a thread pool
-    async def handle_single_title(q: str) -> Dict[str, Any]:
-        raw_results, error = await loop.run_in_executor(None, _search_gutendex, q, max_results_per_title)
+    results: List[Dict[str, Any]] = []
 
-        match_dicts: List[Dict[str, Any]] = []
-        if raw_results:
-            for book in raw_results:
-                if not isinstance(book, dict):
-                    continue
-                match_dicts.append(_normalize_book(book, download_text=download_text, max_chars=max_chars))
+    async with _http_session() as session:
+        downloads: Dict[str, "asyncio.Future[Tuple[Optional[str], Optional[str]]]"] = {}
+
+        # All searches and text downloads share one session, so they fan out concurrently
+        async def handle_single_title(q: str) -> Dict[str, Any]:
+            raw_results, error = await _search_gutendex(session, q, max_results_per_title)
+
+            match_dicts: List[Dict[str, Any]] = [
+                _normalize_book_metadata(book, resolve_text_url)
+                for book in raw_results or []
+                if isinstance(book, dict)
+            ]
+
+            if download_text:
+                # Fetch all texts for this title concurrently, then splice them back in
+                to_fetch = [m for m in match_dicts if m["text_url"]]
+                texts = await asyncio.gather(
+                    *[_fetch_text(session, m["text_url"], max_chars, downloads) for m in to_fetch]
+                )
+                for match in match_dicts:
+                    match["text"] = None
+                for match, (text, text_error) in zip(to_fetch, texts):
+                    match["text"] = text
+                    if text_error:
+                        match["text_error"] = text_error
+
+            match_dicts = [_select_fields(m, fields) for m in match_dicts]
+
+            entry: Dict[str, Any] = {
+                "query": q,
+                "matches": match_dicts,
+            }
+            if error:
+                entry["error"] = error
 
-        entry: Dict[str, Any] = {
-            "query": q,
-            "matches": match_dicts,
-        }
-        if error:
-            entry["error"] = error
+            return entry
 
-        return entry
+        tasks = {key: asyncio.create_task(handle_single_title(q)) for key, q in unique_titles.items()}
+        await asyncio.gather(*tasks.values())
 
-    tasks = [handle_single_title(q) for q in cleaned_titles]
-    for entry in await asyncio.gather(*tasks):
+    # Rebuild one entry per input title, in the original order
+    for q in cleaned_titles:
+        entry = tasks[q.lower()].result()
+        if entry["query"] != q:
+            entry = {**entry, "query": q}
         results.append(entry)
 
     return {"results": results}
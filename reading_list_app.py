@@ -19,11 +19,24 @@ Requirements:
 """
 
 import argparse
+import asyncio
 import json
 import os
-from typing import Any, Dict, List
+import sys
+from typing import Any, Dict, List, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # orjson is an optional speedup
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
 
 from guttenread_mcp.server import search_gutenberg
 
@@ -33,90 +46,134 @@ def read_input_text(path: str | None) -> str:
         with open(path, "r", encoding="utf-8") as f:
             return f.read()
     print("Paste your reading list (Ctrl-D to end on Unix / Ctrl-Z then Enter on Windows):")
-    return "".join(iter(input, ""))  # type: ignore[arg-type]
+    return sys.stdin.read()
+
+
+# Tool schema that the OpenAI model sees. It never changes, so build it once.
+_TOOLS_SPEC: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "search_gutenberg",
+            "description": (
+                "Search Project Gutenberg (via the Gutendex API) for books "
+                "matching the given titles, returning structured metadata "
+                "and optionally text excerpts."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "titles": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": (
+                            "A list of normalized book titles to search for. "
+                            "You should deduplicate titles and remove obviously invalid entries."
+                        ),
+                    },
+                    "max_results_per_title": {
+                        "type": "integer",
+                        "description": "Maximum number of matches per title.",
+                        "default": 3,
+                    },
+                    "download_text": {
+                        "type": "boolean",
+                        "description": (
+                            "If true, download text excerpts for the matches. "
+                            "Use this only if you actually need to read/summarize the text."
+                        ),
+                        "default": False,
+                    },
+                    "max_chars": {
+                        "type": ["integer", "null"],
+                        "description": (
+                            "If set, truncate downloaded texts to at most this many characters. "
+                            "Use a smaller number (e.g. 5000) for summaries."
+                        ),
+                        "default": 20000,
+                    },
+                    "fields": {
+                        "type": ["array", "null"],
+                        "items": {"type": "string"},
+                        "description": (
+                            "If set, only return these fields for each match, e.g. "
+                            '["id", "title", "authors", "gutenberg_url"]. Request only what you need '
+                            "to keep the response small. Available fields: id, title, authors, languages, "
+                            "download_count, subjects, bookshelves, copyright, gutenberg_url, text_url."
+                        ),
+                        "default": None,
+                    },
+                    "include_text_url": {
+                        "type": "boolean",
+                        "description": (
+                            "If false, skip resolving each match's text_url (returned as null). "
+                            "Set this to false when you only need titles/authors and are not downloading texts."
+                        ),
+                        "default": True,
+                    },
+                },
+                "required": ["titles"],
+            },
+        },
+    }
+]
 
 
 def build_tools_spec() -> List[Dict[str, Any]]:
     """
-    Define the tool schema that the OpenAI model sees.
+    Return the tool schema that the OpenAI model sees.
     The actual implementation is in this script (we call search_gutenberg).
     """
-    return [
-        {
-            "type": "function",
-            "function": {
-                "name": "search_gutenberg",
-                "description": (
-                    "Search Project Gutenberg (via the Gutendex API) for books "
-                    "matching the given titles, returning structured metadata "
-                    "and optionally text excerpts."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "titles": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": (
-                                "A list of normalized book titles to search for. "
-                                "You should deduplicate titles and remove obviously invalid entries."
-                            ),
-                        },
-                        "max_results_per_title": {
-                            "type": "integer",
-                            "description": "Maximum number of matches per title.",
-                            "default": 3,
-                        },
-                        "download_text": {
-                            "type": "boolean",
-                            "description": (
-                                "If true, download text excerpts for the matches. "
-                                "Use this only if you actually need to read/summarize the text."
-                            ),
-                            "default": False,
-                        },
-                        "max_chars": {
-                            "type": ["integer", "null"],
-                            "description": (
-                                "If set, truncate downloaded texts to at most this many characters. "
-                                "Use a smaller number (e.g. 5000) for summaries."
-                            ),
-                            "default": 20000,
-                        },
-                    },
-                    "required": ["titles"],
-                },
-            },
-        }
-    ]
+    return _TOOLS_SPEC
 
 
-def call_search_gutenberg_tool(args: Dict[str, Any]) -> Dict[str, Any]:
+async def call_search_gutenberg_tool(args: Dict[str, Any]) -> Dict[str, Any]:
     """
     Local implementation of the `search_gutenberg` tool that the model calls.
     We just forward to the existing async function and return its result.
     """
-    import asyncio
-
     titles = args.get("titles") or []
     max_results_per_title = int(args.get("max_results_per_title", 3))
     download_text = bool(args.get("download_text", False))
     max_chars = args.get("max_chars", 20000)
+    fields = args.get("fields")
+    include_text_url = bool(args.get("include_text_url", True))
 
     if max_chars is not None:
         max_chars = int(max_chars)
 
-    return asyncio.run(
-        search_gutenberg(
-            titles=titles,
-            max_results_per_title=max_results_per_title,
-            download_text=download_text,
-            max_chars=max_chars,
-        )
+    if fields is not None and not isinstance(fields, list):
+        return {"error": "fields must be a list of field names (or null), not a single string or other value"}
+
+    return await search_gutenberg(
+        titles=titles,
+        max_results_per_title=max_results_per_title,
+        download_text=download_text,
+        max_chars=max_chars,
+        fields=fields,
+        include_text_url=include_text_url,
     )
 
 
-def main() -> None:
+async def run_tool_call(name: str, parsed_args: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Dispatch a single tool call requested by the model."""
+    if name == "search_gutenberg":
+        return await call_search_gutenberg_tool({**defaults, **parsed_args})
+    return {"error": f"Unknown tool {name}"}
+
+
+def _try_parse_arguments(raw_args: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse streamed tool-call arguments, returning None while they are still incomplete.
+    """
+    try:
+        parsed, _ = json.JSONDecoder().raw_decode(raw_args.strip())
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+async def main_async() -> None:
     parser = argparse.ArgumentParser(description="Reading list app using OpenAI + Guttenread.")
     parser.add_argument(
         "--input-file",
@@ -146,7 +203,7 @@ def main() -> None:
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
 
-    client = OpenAI(api_key=api_key)
+    client = AsyncOpenAI(api_key=api_key)
 
     reading_list_text = read_input_text(args.input_file)
 
@@ -192,45 +249,80 @@ def main() -> None:
     }
 
     while True:
-        completion = client.chat.completions.create(
+        stream = await client.chat.completions.create(
             model=args.model,
             messages=messages,
             tools=tools,
             tool_choice="auto",
+            stream=True,
         )
 
-        message = completion.choices[0].message
+        content_parts: List[str] = []
+        # Tool calls arrive as fragments keyed by index; accumulate them in message format
+        tool_calls: Dict[int, Dict[str, Any]] = {}
+        pending: Dict[int, "asyncio.Task[Dict[str, Any]]"] = {}
 
-        if message.tool_calls:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+
+            if delta.content:
+                content_parts.append(delta.content)
+
+            for tc in delta.tool_calls or []:
+                call = tool_calls.setdefault(
+                    tc.index,
+                    {"id": None, "type": "function", "function": {"name": "", "arguments": ""}},
+                )
+                if tc.id:
+                    call["id"] = tc.id
+                if tc.function:
+                    if tc.function.name:
+                        call["function"]["name"] += tc.function.name
+                    if tc.function.arguments:
+                        call["function"]["arguments"] += tc.function.arguments
+
+                # Start the tool as soon as its arguments form a complete JSON object,
+                # so it runs while the model is still streaming
+                if tc.index not in pending:
+                    parsed_args = _try_parse_arguments(call["function"]["arguments"])
+                    if parsed_args is not None:
+                        pending[tc.index] = asyncio.create_task(
+                            run_tool_call(call["function"]["name"], parsed_args, tool_call_defaults)
+                        )
+
+        content = "".join(content_parts) or None
+
+        if tool_calls:
             # The model wants to call one or more tools
+            ordered_calls = [tool_calls[i] for i in sorted(tool_calls)]
             messages.append(
                 {
                     "role": "assistant",
-                    "content": message.content,
-                    "tool_calls": [tc.model_dump() for tc in message.tool_calls],
+                    "content": content,
+                    "tool_calls": ordered_calls,
                 }
             )
 
-            for tool_call in message.tool_calls:
-                name = tool_call.function.name
-                raw_args = tool_call.function.arguments or "{}"
-                try:
-                    parsed_args = json.loads(raw_args)
-                except json.JSONDecodeError:
-                    parsed_args = {}
-
-                if name == "search_gutenberg":
-                    merged_args = {**tool_call_defaults, **parsed_args}
-                    tool_result = call_search_gutenberg_tool(merged_args)
-                else:
-                    tool_result = {"error": f"Unknown tool {name}"}
+            # Await every call concurrently; calls whose arguments never parsed as a
+            # JSON object run with the defaults only
+            tool_results = await asyncio.gather(
+                *[
+                    pending[index]
+                    if index in pending
+                    else run_tool_call(tool_calls[index]["function"]["name"], {}, tool_call_defaults)
+                    for index in sorted(tool_calls)
+                ]
+            )
 
+            for call, tool_result in zip(ordered_calls, tool_results):
                 messages.append(
                     {
                         "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "name": name,
-                        "content": json.dumps(tool_result),
+                        "tool_call_id": call["id"],
+                        "name": call["function"]["name"],
+                        "content": _json_dumps(tool_result),
                     }
                 )
 
@@ -238,12 +330,16 @@ def main() -> None:
             continue
 
         # No tool calls: final answer
-        messages.append({"role": "assistant", "content": message.content})
+        messages.append({"role": "assistant", "content": content})
         print("\n=== MODEL OUTPUT ===\n")
-        print(message.content or "")
+        print(content or "")
         break
 
 
+def main() -> None:
+    asyncio.run(main_async())
+
+
 if __name__ == "__main__":
     main()
 